@@ -38,11 +38,12 @@ This loader:
 
 from __future__ import annotations
 import argparse
+import itertools
 import os
-import re
+import stat
 import sys
 from pathlib import Path
-from typing import Dict, Iterable
+from typing import Dict, Iterable, Tuple
 
 REQUIRED_KEYS = ["OPENAI_API_KEY"]
 OPTIONAL_KEYS = ["OPENAI_ORG", "OPENAI_PROJECT", "MODEL_ID"]
@@ -60,11 +61,50 @@ OPENAI_PROJECT=proj-REPLACE_ME
 MODEL_ID=gpt-5-thinking
 """
 
-_KEY_VAL_RE = re.compile(
-    r"""^\s*(?:export\s+)?(?P<key>[A-Za-z_][A-Za-z0-9_]*)\s*=\s*(?P<val>.*)\s*$"""
-)
+# Parsed .env contents keyed by (resolved path, mtime_ns, size); see load_env_file.
+_PARSE_CACHE: Dict[Tuple[str, int, int], Dict[str, str]] = {}
 
-_VAR_REF_RE = re.compile(r"\$\{?([A-Za-z_][A-Za-z0-9_]*)\}?")
+# Lookup table over byte values: 1 for characters allowed in a key name
+# ([A-Za-z0-9_]). Lets the line scanner avoid regex matching entirely.
+_KEY_CHARS = bytearray(256)
+for _ch in "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_":
+    _KEY_CHARS[ord(_ch)] = 1
+del _ch
+
+def _scan_name(s: str, i: int) -> int:
+    """
+    Return the end index of a name ([A-Za-z_][A-Za-z0-9_]*) starting at s[i],
+    or i itself if no name starts there.
+    """
+    n = len(s)
+    if i >= n or "0" <= s[i] <= "9":
+        return i
+    j = i
+    while j < n:
+        o = ord(s[j])
+        if o > 255 or not _KEY_CHARS[o]:
+            break
+        j += 1
+    return j
+
+def _split_key_val(line: str, start: int = 0) -> tuple[str, str] | None:
+    """
+    Split a stripped, non-comment line into (key, raw_value).
+    Returns None if the line is not of the form KEY=VALUE.
+    """
+    n = len(line)
+    end = _scan_name(line, start)
+    if end == start:
+        return None
+    i = end
+    while i < n and line[i].isspace():
+        i += 1
+    if i >= n or line[i] != "=":
+        return None
+    i += 1
+    while i < n and line[i].isspace():
+        i += 1
+    return line[start:end], line[i:]
 
 def _unquote(val: str) -> str:
     val = val.strip()
@@ -92,12 +132,34 @@ def _interpolate(val: str, scope: Dict[str, str]) -> str:
     Replace ${VAR} or $VAR with values from scope or os.environ if present.
     Simple one-pass (sufficient for most .env files).
     """
-    def repl(m):
-        name = m.group(1)
+    i = val.find("$")
+    if i == -1:
+        return val
+    n = len(val)
+    out = []
+    pos = 0
+    while i != -1:
+        j = i + 1
+        if j < n and val[j] == "{":
+            j += 1
+        end = _scan_name(val, j)
+        if end == j:
+            # Not a reference ("$" alone, "$1", "${}"): keep it literally
+            i = val.find("$", i + 1)
+            continue
+        name = val[j:end]
+        if end < n and val[end] == "}":
+            end += 1
         if name in scope:
-            return scope[name]
-        return os.environ.get(name, m.group(0))
-    return _VAR_REF_RE.sub(repl, val)
+            repl = scope[name]
+        else:
+            repl = os.environ.get(name, val[i:end])
+        out.append(val[pos:i])
+        out.append(repl)
+        pos = end
+        i = val.find("$", end)
+    out.append(val[pos:])
+    return "".join(out)
 
 def parse_dotenv(text: str) -> Dict[str, str]:
     """
@@ -111,15 +173,24 @@ def parse_dotenv(text: str) -> Dict[str, str]:
     parsed: Dict[str, str] = {}
     for raw_line in text.splitlines():
         line = raw_line.strip()
-        if not line or line.startswith("#"):
+        if not line or line[0] == "#":
             continue
-        m = _KEY_VAL_RE.match(line)
-        if not m:
+        kv = None
+        if line.startswith("export") and len(line) > 6 and line[6].isspace():
+            i = 7
+            while line[i].isspace():
+                i += 1
+            kv = _split_key_val(line, i)
+        if kv is None:
+            kv = _split_key_val(line)
+        if kv is None:
             # Skip malformed lines silently
             continue
-        key, val = m.group("key"), m.group("val")
-        val = _unquote(val)
-        val = _interpolate(val, {**os.environ, **parsed})
+        key, val = kv
+        if val and val[0] in ("'", '"'):
+            val = _unquote(val)
+        # Parsed keys take precedence over os.environ (see _interpolate)
+        val = _interpolate(val, parsed)
         parsed[key] = val
     return parsed
 
@@ -129,25 +200,50 @@ def load_env_file(
     optional_keys: Iterable[str] = OPTIONAL_KEYS,
     override: bool = False,
     strict: bool = True,
+    use_cache: bool = True,
 ) -> Dict[str, str]:
     """
     Read .env file and populate os.environ (optionally not overriding existing vars).
     - required_keys: ensure these exist in the final environment; raise if missing and strict=True.
     - optional_keys: not enforced; included for template generation and docs.
+    - use_cache: reuse the parse result of an earlier call if the file's mtime and size are unchanged.
     Returns dict of keys loaded/affected (not including pre-existing ones if override=False).
+    The file is not touched at all (returns {}) only when override=False, strict=False and
+    EVERY required and optional key is already present in os.environ - with the defaults
+    that includes OPENAI_ORG and OPENAI_PROJECT (export them empty to opt in). Other
+    keys in the file are then not loaded.
     """
+    # Env already provided by the shell: nothing in the file could be applied, so skip
+    # stat/read/parse. Presence (not truthiness) matches the apply loop below, where an
+    # existing var - even empty - is never overwritten. Optional keys count too, so e.g.
+    # MODEL_ID from .env is not silently ignored; strict mode still goes to disk so a
+    # missing .env is reported.
+    required_keys = list(required_keys)  # iterated twice (here and in validation below)
+    if not override and not strict and all(
+        k in os.environ for k in itertools.chain(required_keys, optional_keys)
+    ):
+        return {}
+
     p = Path(path)
-    if not p.exists() or not p.is_file():
+    try:
+        st = p.stat()
+    except OSError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
         if strict:
             raise FileNotFoundError(f".env file not found at: {p.resolve()}")
         else:
             return {}
 
-    try:
-        text = p.read_text(encoding="utf-8")
-    except UnicodeDecodeError:
-        text = p.read_text(encoding="utf-8", errors="ignore")
-    env_map = parse_dotenv(text)
+    key = (str(p.resolve()), st.st_mtime_ns, st.st_size)
+    env_map = _PARSE_CACHE.get(key) if use_cache else None
+    if env_map is None:
+        try:
+            text = p.read_text(encoding="utf-8")
+        except UnicodeDecodeError:
+            text = p.read_text(encoding="utf-8", errors="ignore")
+        env_map = parse_dotenv(text)
+        _PARSE_CACHE[key] = env_map
 
     applied: Dict[str, str] = {}
     for k, v in env_map.items():
@@ -163,6 +259,10 @@ def load_env_file(
 
     return applied
 
+def clear_cache() -> None:
+    """Forget all cached .env parse results (e.g. between tests)."""
+    _PARSE_CACHE.clear()
+
 def write_template(path: str | Path = ".env.template", force: bool = False) -> Path:
     """
     Write a .env.template with stub values.
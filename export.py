@@ -14,11 +14,16 @@ Examples:
   # Multiple PDFs, recursive, JPEG at 300 DPI into ./out
   python pdf2images.py -r -o out -f jpg -d 300 docs/
 
+  # Render pages on 4 worker processes (default: one per CPU; -j 1 = serial)
+  python export.py -j 4 -o images docs/report.pdf
+
   # Encrypted PDF (if needed)
   python pdf2images.py --password "secret" secured.pdf
 """
 import argparse
+import os
 import sys
+from concurrent.futures import Executor, ProcessPoolExecutor
 from pathlib import Path
 
 try:
@@ -28,19 +33,21 @@ except ImportError:
     sys.exit(1)
 
 
-def export_pdf(
+def _render_pages(
     pdf_path: Path,
-    out_dir: Path | None = None,
-    fmt: str = "png",
-    dpi: int = 200,
-    suffix_sep: str = "_",
-    overwrite: bool = False,
-    password: str | None = None,
+    page_indices: range,
+    out_dir: Path,
+    fmt: str,
+    dpi: int,
+    suffix_sep: str,
+    overwrite: bool,
+    password: str | None,
+    quality: int = 95,
 ) -> int:
-    if out_dir is None:
-        out_dir = pdf_path.parent
-    out_dir.mkdir(parents=True, exist_ok=True)
-
+    """
+    Render and save the given pages of one PDF. Runs in a worker process, so it
+    opens its own fitz.Document (documents cannot be pickled).
+    """
     try:
         doc = fitz.open(pdf_path)
     except Exception as e:
@@ -49,25 +56,28 @@ def export_pdf(
 
     try:
         if doc.needs_pass:
-            if not password or not doc.authenticate(password):
-                sys.stderr.write(f"[ERROR] Password required or incorrect for {pdf_path}\n")
-                doc.close()
-                return 0
+            doc.authenticate(password or "")
 
         mat = fitz.Matrix(dpi / 72.0, dpi / 72.0)  # scale to target DPI
         base = pdf_path.stem  # keep original base name
         pages_exported = 0
 
-        for i in range(doc.page_count):
+        for i in page_indices:
             try:
-                page = doc.load_page(i)
-                pix = page.get_pixmap(matrix=mat, alpha=False)  # opaque output
                 out_name = f"{base}{suffix_sep}{i}.{fmt.lower()}"
                 out_path = out_dir / out_name
                 if out_path.exists() and not overwrite:
                     print(f"[SKIP] {out_path} exists (use --overwrite to replace)")
                     continue
-                pix.save(out_path)
+                page = doc.load_page(i)
+                pix = page.get_pixmap(matrix=mat, alpha=False)  # opaque output
+                # Encode in memory and write once; JPEG goes straight to libjpeg with our quality
+                if fmt == "jpg":
+                    out_path.write_bytes(pix.tobytes("jpeg", jpg_quality=quality))
+                elif fmt == "png":
+                    out_path.write_bytes(pix.tobytes("png"))
+                else:
+                    pix.save(out_path)
                 pages_exported += 1
                 print(f"[OK] {pdf_path.name} -> {out_path}")
             except Exception as pe:
@@ -78,12 +88,73 @@ def export_pdf(
         doc.close()
 
 
+def export_pdf(
+    pdf_path: Path,
+    out_dir: Path | None = None,
+    fmt: str = "png",
+    dpi: int = 200,
+    suffix_sep: str = "_",
+    overwrite: bool = False,
+    password: str | None = None,
+    quality: int = 95,
+    pool: Executor | None = None,
+    jobs: int = 1,
+) -> int:
+    """
+    Export every page of pdf_path. If pool (with jobs workers) is given, pages
+    are split into slices and rendered in parallel; otherwise serially.
+    """
+    if out_dir is None:
+        out_dir = pdf_path.parent
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    try:
+        doc = fitz.open(pdf_path)
+    except Exception as e:
+        sys.stderr.write(f"[ERROR] Cannot open {pdf_path}: {e}\n")
+        return 0
+
+    try:
+        if doc.needs_pass:
+            if not password or not doc.authenticate(password):
+                sys.stderr.write(f"[ERROR] Password required or incorrect for {pdf_path}\n")
+                return 0
+        page_count = doc.page_count
+    finally:
+        doc.close()
+
+    args = (out_dir, fmt, dpi, suffix_sep, overwrite, password, quality)
+    if pool is None or page_count < 2:
+        return _render_pages(pdf_path, range(page_count), *args)
+
+    # ~4 slices per worker balances load without reopening the PDF per page
+    chunk = max(1, page_count // (4 * max(1, jobs)))
+    futures = [
+        pool.submit(_render_pages, pdf_path, range(start, min(start + chunk, page_count)), *args)
+        for start in range(0, page_count, chunk)
+    ]
+    return sum(f.result() for f in futures)
+
+
+def _is_pdf_name(name: str) -> bool:
+    # Same rule as the single-file case: a ".pdf" extension in any case, but not a bare ".pdf"
+    return os.path.splitext(name)[1].lower() == ".pdf"
+
+
 def iter_pdfs(target: Path, recursive: bool) -> list[Path]:
     if target.is_file() and target.suffix.lower() == ".pdf":
         return [target]
     if target.is_dir():
-        pattern = "**/*.pdf" if recursive else "*.pdf"
-        return sorted(p for p in target.glob(pattern) if p.is_file())
+        # Match on plain names and only build Paths for hits
+        if recursive:
+            return sorted(
+                Path(dp) / fn
+                for dp, _, fns in os.walk(target)
+                for fn in fns
+                if _is_pdf_name(fn)
+            )
+        with os.scandir(target) as it:
+            return sorted(target / e.name for e in it if e.is_file() and _is_pdf_name(e.name))
     return []
 
 
@@ -94,10 +165,13 @@ def main():
     ap.add_argument("-f", "--format", choices=["png", "jpg", "jpeg", "tiff", "bmp"], default="png",
                     help="Image format/extension (default: png)")
     ap.add_argument("-d", "--dpi", type=int, default=200, help="Output DPI (default: 200)")
+    ap.add_argument("-q", "--quality", type=int, default=95, help="JPEG quality 1-100 (default: 95)")
     ap.add_argument("-s", "--suffix-sep", default="_", help="Separator before page index (default: _)")
     ap.add_argument("--overwrite", action="store_true", help="Overwrite existing images")
     ap.add_argument("-r", "--recursive", action="store_true", help="Recurse into directories")
     ap.add_argument("--password", default=None, help="Password for encrypted PDFs (optional)")
+    ap.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                    help="Worker processes for page rendering (default: CPU count; 1 = serial)")
     args = ap.parse_args()
 
     fmt = "jpg" if args.format.lower() == "jpeg" else args.format.lower()
@@ -105,23 +179,31 @@ def main():
     total_pages = 0
     seen_any = False
 
-    for p in args.paths:
-        target = Path(p)
-        pdfs = iter_pdfs(target, args.recursive)
-        if not pdfs and target.is_file():
-            sys.stderr.write(f"[WARN] Not a PDF or not found: {target}\n")
-        for pdf in pdfs:
-            seen_any = True
-            out_dir = args.out if args.out else pdf.parent
-            total_pages += export_pdf(
-                pdf_path=pdf,
-                out_dir=out_dir,
-                fmt=fmt,
-                dpi=args.dpi,
-                suffix_sep=args.suffix_sep,
-                overwrite=args.overwrite,
-                password=args.password,
-            )
+    pool = ProcessPoolExecutor(max_workers=args.jobs) if args.jobs > 1 else None
+    try:
+        for p in args.paths:
+            target = Path(p)
+            pdfs = iter_pdfs(target, args.recursive)
+            if not pdfs and target.is_file():
+                sys.stderr.write(f"[WARN] Not a PDF or not found: {target}\n")
+            for pdf in pdfs:
+                seen_any = True
+                out_dir = args.out if args.out else pdf.parent
+                total_pages += export_pdf(
+                    pdf_path=pdf,
+                    out_dir=out_dir,
+                    fmt=fmt,
+                    dpi=args.dpi,
+                    suffix_sep=args.suffix_sep,
+                    overwrite=args.overwrite,
+                    password=args.password,
+                    quality=args.quality,
+                    pool=pool,
+                    jobs=args.jobs,
+                )
+    finally:
+        if pool is not None:
+            pool.shutdown()
 
     if not seen_any:
         sys.stderr.write("[INFO] No PDFs found.\n")
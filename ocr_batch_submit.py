@@ -17,6 +17,7 @@ and stores "Yes"/"No" in the saved JSON.
 
 WHAT YOU NEED TO EDIT / PROVIDE:
 1) Install deps:  pip install --upgrade openai
+   (optional speed-ups: pip install orjson pybase64)
 2) Put your OCR instructions in: ./prompt.txt
 3) (Optional) Put a *reference list* of expected candidates/parties in: ./liste.txt (one name per line).
    - The script will include this list if available and non-empty; otherwise it will ignore it.
@@ -34,19 +35,29 @@ NOTES
 - Files that share the same base name except trailing numeric/similar suffixes are grouped
   (e.g., "report.png", "report_1.png", "report-2.png", "report (3).png" → one group).
 - For each group, we send ONE request with the prompt + ALL images in that group.
+- Groups are processed in parallel worker threads: at most --concurrency (default 4) groups
+  are in progress at once, each in its OCR or its validator call; a group's validator call
+  overlaps the OCR calls of the groups after it, and its images are dropped once it is saved.
 - The model is expected to return STRICT JSON per your prompt. We still sanitize if needed.
-- The second call is a simple validator that returns "Yes" or "No" only.
+- The second call is a simple validator that returns "Yes" or "No" only. It is skipped (answer "Yes")
+  when the JSON already passes a local structural check; use --always-validate to force it.
 - The resulting JSON file is named: <group_prefix>.json (created under --out).
 """
 
 import argparse
 import base64
+import functools
+import itertools
 import json
+import operator
 import os
 import re
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Dict, List, Tuple, Optional
 
 # --- Load .env early so env vars are available before we read MODEL_ID ---
@@ -57,7 +68,14 @@ except Exception as _e:
     print(f"[ENV] {_e}", file=sys.stderr)
 
 # ---------- MODEL CONFIG (env-driven with fallback) ----------
-MODEL_ID = os.getenv("MODEL_ID", "gpt-5-thinking")
+# Environment is read once, right after .env is loaded; everything below uses _ENV.
+_ENV = SimpleNamespace(
+    api_key=os.environ.get("OPENAI_API_KEY"),
+    org=os.environ.get("OPENAI_ORG"),
+    project=os.environ.get("OPENAI_PROJECT"),
+    model=os.environ.get("MODEL_ID", "gpt-5-thinking"),
+)
+MODEL_ID = _ENV.model
 # -------------------------------------------------------------
 
 # ---- OpenAI client setup (reads env vars) ----
@@ -67,39 +85,63 @@ except ImportError:
     sys.stderr.write("Missing dependency: pip install --upgrade openai\n")
     sys.exit(1)
 
+# Optional: orjson serializes much faster than stdlib json (pip install orjson)
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+
+# Optional: pybase64 uses SIMD (AVX2/NEON) base64 kernels (pip install pybase64)
+try:
+    from pybase64 import b64encode as _b64encode
+except ImportError:
+    _b64encode = base64.b64encode
+
+@functools.lru_cache(maxsize=None)
 def make_client():
     """
     Initialize OpenAI client using environment variables:
       OPENAI_API_KEY (required)
       OPENAI_ORG (optional)
       OPENAI_PROJECT (optional)
+    The client is created once; later calls return the same (thread-safe) instance.
     """
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
+    if not _ENV.api_key:
         sys.stderr.write("ERROR: Please set OPENAI_API_KEY.\n")
         sys.exit(1)
 
-    org = os.getenv("OPENAI_ORG")
-    project = os.getenv("OPENAI_PROJECT")
-
-    if org and project:
-        return OpenAI(api_key=api_key, organization=org, project=project)
-    elif org:
-        return OpenAI(api_key=api_key, organization=org)
-    else:
-        return OpenAI(api_key=api_key)
+    kwargs = {"api_key": _ENV.api_key}
+    if _ENV.org:
+        kwargs["organization"] = _ENV.org
+    if _ENV.project:
+        kwargs["project"] = _ENV.project
+    return OpenAI(**kwargs)
 
 
 # -------------- Utility functions --------------
 
 PNG_EXTS = {".png"}  # adjust if you later want jpg/jpeg/tiff, etc.
 
-_SUFFIX_PATTERNS = [
+_SUFFIX_RES = [re.compile(p, re.IGNORECASE) for p in (
     r"[\s_\-]*(?:\(?\d+\)?)[\s]*$",             # _1, -2, (3), " 4"
     r"[\s_\-]*page[\s]*\d+[\s]*$",
     r"[\s_\-]*str(?:ana)?[\s]*\d+[\s]*$",       # str2, strana 3 (Serbian variants)
     r"[\s_\-]*pg[\s]*\d+[\s]*$",
-]
+)]
+
+_UNSAFE_FN_RE = re.compile(r'[\\/:*?"<>|]+')
+_UNSAFE_FN_TABLE = str.maketrans({c: "_" for c in '\\/:*?"<>|'})
+
+class _NonFiniteFloat(float):
+    """
+    NaN/Infinity parsed from model output (json accepts them). orjson rejects float
+    subclasses, so json_dumps_bytes sends exactly these objects to stdlib json, which
+    writes them back as NaN/Infinity instead of null - without re-walking every result.
+    """
+    __slots__ = ()
+
+_JSON_DECODER = json.JSONDecoder(parse_constant=_NonFiniteFloat)
 
 def derive_group_key(stem: str) -> str:
     """
@@ -107,83 +149,160 @@ def derive_group_key(stem: str) -> str:
     We DO NOT strip internal digits (to avoid over-grouping different docs).
     """
     s = stem
-    for pat in _SUFFIX_PATTERNS:
-        s2 = re.sub(pat, "", s, flags=re.IGNORECASE)
+    for rx in _SUFFIX_RES:
+        s2 = rx.sub("", s)
         if s2 != s:
             s = s2
             break  # remove only one suffix occurrence
     return s.strip()
 
+def _natural_num(stem: str) -> int:
+    """
+    Trailing page number of a file stem (for natural page order); 10**9 if there is none.
+    That is the last run of digits, possibly followed by non-digits ("p12a" -> 12).
+    Right-to-left scan; isdecimal() matches the same characters as regex \d.
+    """
+    end = len(stem)
+    while end > 0 and not stem[end - 1].isdecimal():
+        end -= 1
+    if end == 0:
+        return 10**9
+    start = end - 1
+    while start > 0 and stem[start - 1].isdecimal():
+        start -= 1
+    return int(stem[start:end])
+
 def group_images(paths: List[Path]) -> Dict[str, List[Path]]:
     """
     Group PNG images by normalized base name (without trailing numeric/similar suffix).
     Returns: dict[group_key] = [Path, Path, ...] (sorted by natural numeric order)
     """
-    buckets: Dict[str, List[Path]] = {}
-    for p in paths:
-        stem = p.stem
-        key = derive_group_key(stem).lower()
-        buckets.setdefault(key, []).append(p)
-
-    # Sort files in each group by a natural numeric key (page order)
-    def natural_key(p: Path):
-        # pick the trailing number if present for better page ordering
-        m = re.search(r"(\d+)\D*$", p.stem)
-        if m:
-            try:
-                return (int(m.group(1)), p.name)
-            except Exception:
-                pass
-        return (10**9, p.name)
-
-    for k in list(buckets.keys()):
-        buckets[k].sort(key=natural_key)
-    return buckets
+    # Derive each path's group key and page number exactly once, then one global
+    # tuple sort yields both the grouping and the per-group page order.
+    decorated = [(derive_group_key(p.stem).lower(), _natural_num(p.stem), p.name, p) for p in paths]
+    decorated.sort()
+    return {
+        k: [t[3] for t in g]
+        for k, g in itertools.groupby(decorated, key=operator.itemgetter(0))
+    }
+
+# Read size for streaming base64; a multiple of 3 so no chunk but the last is padded.
+_B64_CHUNK = 57 * 1024
 
 def encode_image_to_data_url(path: Path) -> str:
     """
     Read PNG and return a data URL suitable for multimodal messages.
+    The file is encoded in fixed-size chunks so the raw bytes are never held in full.
     """
+    parts = ["data:image/png;base64,"]
     with path.open("rb") as f:
-        b64 = base64.b64encode(f.read()).decode("ascii")
-    return f"data:image/png;base64,{b64}"
+        while chunk := f.read(_B64_CHUNK):
+            parts.append(_b64encode(chunk).decode("ascii"))
+    return "".join(parts)
+
+def image_content_parts(image_paths: List[Path], image_urls: Optional[List[str]] = None) -> List[dict]:
+    """
+    Build the image_url message parts for image_paths.
+    Pass image_urls (data URLs in the same order) to reuse an earlier encoding pass.
+    """
+    if image_urls is None:
+        image_urls = [encode_image_to_data_url(p) for p in image_paths]
+    return [{"type": "image_url", "image_url": {"url": url}} for url in image_urls]
+
+def upload_images(client: OpenAI, image_paths: List[Path]) -> List[str]:
+    """
+    Upload each image once via the Files API (purpose="vision") and return the file ids,
+    so the OCR and validator calls can reference the same upload.
+    """
+    file_ids = []
+    try:
+        for p in image_paths:
+            with p.open("rb") as f:
+                file_ids.append(client.files.create(file=f, purpose="vision").id)
+    except Exception:
+        delete_uploaded_images(client, file_ids)
+        raise
+    return file_ids
+
+def delete_uploaded_images(client: OpenAI, file_ids: List[str]) -> None:
+    for fid in file_ids:
+        try:
+            client.files.delete(fid)
+        except Exception as e:
+            sys.stderr.write(f"[WARN] Could not delete uploaded file {fid}: {e}\n")
+
+def respond_with_file_images(
+    client: OpenAI,
+    model: str,
+    system_text: str,
+    user_texts: List[str],
+    file_ids: List[str]
+) -> str:
+    """
+    One multimodal request through the Responses API, with images referenced by uploaded
+    file id (Chat Completions only accepts images as URLs/data URLs). Returns the output text.
+    """
+    content = [{"type": "input_text", "text": t} for t in user_texts]
+    content.extend({"type": "input_image", "file_id": fid} for fid in file_ids)
+    resp = client.responses.create(
+        model=model,
+        instructions=system_text,
+        input=[{"role": "user", "content": content}]
+    )
+    return resp.output_text or ""
+
+def json_dumps_bytes(obj, indent: bool = False) -> bytes:
+    """
+    UTF-8 JSON for obj (2-space indent if requested). Uses orjson when available,
+    falling back to stdlib json for objects orjson rejects: ints beyond 64 bits, and
+    NaN/Infinity from extract_first_json_block (parsed as _NonFiniteFloat), which
+    orjson would otherwise write as null.
+    """
+    if HAVE_ORJSON:
+        opts = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(obj, option=opts)
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
 
 def ensure_dir(d: Path):
     d.mkdir(parents=True, exist_ok=True)
 
 def extract_first_json_block(text: str) -> Tuple[dict, str]:
     """
-    Try to parse JSON directly; if fails, extract the first {...} block and parse.
+    Try to parse JSON directly; if fails, decode the first {...} object embedded in the text.
     Returns (parsed_json, raw_text). If parsing fails, returns ({}, raw_text).
     """
     raw = text.strip()
     # Fast path
     try:
-        return json.loads(raw), raw
+        return _JSON_DECODER.decode(raw), raw
     except Exception:
         pass
 
-    # Try to extract the first JSON object
-    m = re.search(r"\{.*\}", raw, flags=re.DOTALL)
-    if m:
-        candidate = m.group(0)
+    # Try each '{' in turn; raw_decode parses forward and ignores trailing text
+    i = raw.find("{")
+    while i != -1:
         try:
-            return json.loads(candidate), raw
-        except Exception:
-            return {}, raw
+            obj, _ = _JSON_DECODER.raw_decode(raw, i)
+            return obj, raw
+        except json.JSONDecodeError:
+            i = raw.find("{", i + 1)
     return {}, raw
 
 def clamp_yes_no(s: str) -> str:
-    s = (s or "").strip().lower()
-    if s.startswith("y"):
-        return "Yes"
-    if s.startswith("n"):
+    s = (s or "").lstrip()
+    if not s:
         return "No"
-    if "yes" in s:
+    # Expected replies are a bare "Yes"/"No": decide on the first character
+    c = s[0]
+    if c in "yY":
         return "Yes"
-    if "no" in s:
+    if c in "nN":
         return "No"
-    return "No"  # be conservative
+    # Answer wrapped in other text; anything without "yes" is conservatively "No"
+    return "Yes" if "yes" in s.lower() else "No"
 
 
 # -------- Optional candidate list (liste.txt) --------
@@ -252,34 +371,40 @@ def call_model_json(
     prompt_text: str,
     image_paths: List[Path],
     candidate_list: Optional[List[str]] = None,
-    max_retries: int = 3
+    max_retries: int = 3,
+    image_urls: Optional[List[str]] = None,
+    file_ids: Optional[List[str]] = None
 ) -> Tuple[dict, str]:
     """
     Send prompt + multiple images (+ optional reference candidate list) to the multimodal chat model.
+    image_urls: optional precomputed data URLs for image_paths (see image_content_parts).
+    file_ids: if given, images are referenced by uploaded file id via the Responses API instead.
     Returns (parsed_json, raw_text).
     """
-    content = [{"type": "text", "text": prompt_text}]
+    # The prompt is sent once, as the system message; the user turn only points back to it
+    user_texts = ["Apply the instructions above to the following image(s)."]
     ref_block = format_reference_block(candidate_list or [])
     if ref_block:
-        content.append({"type": "text", "text": ref_block})
+        user_texts.append(ref_block)
 
-    for p in image_paths:
-        content.append({
-            "type": "image_url",
-            "image_url": {"url": encode_image_to_data_url(p)}
-        })
+    if file_ids is None:
+        content = [{"type": "text", "text": t} for t in user_texts]
+        content.extend(image_content_parts(image_paths, image_urls))
 
     for attempt in range(1, max_retries + 1):
         try:
-            resp = client.chat.completions.create(
-                model=model,
-                # temperature=0.0,
-                messages=[
-                    {"role": "system", "content": prompt_text},  # keep the main instructions as system
-                    {"role": "user", "content": content}
-                ]
-            )
-            txt = resp.choices[0].message.content or ""
+            if file_ids is not None:
+                txt = respond_with_file_images(client, model, prompt_text, user_texts, file_ids)
+            else:
+                resp = client.chat.completions.create(
+                    model=model,
+                    # temperature=0.0,
+                    messages=[
+                        {"role": "system", "content": prompt_text},  # keep the main instructions as system
+                        {"role": "user", "content": content}
+                    ]
+                )
+                txt = resp.choices[0].message.content or ""
             parsed, raw = extract_first_json_block(txt)
             return parsed, raw
         except Exception as e:
@@ -297,11 +422,15 @@ def call_validator_yes_no(
     response_json: dict,
     image_paths: List[Path],
     candidate_list: Optional[List[str]] = None,
-    max_retries: int = 3
+    max_retries: int = 3,
+    image_urls: Optional[List[str]] = None,
+    file_ids: Optional[List[str]] = None
 ) -> str:
     """
     Ask the model to judge if the response_json adequately satisfies the prompt,
     returning strictly "Yes" or "No".
+    image_urls: optional precomputed data URLs for image_paths (see image_content_parts).
+    file_ids: if given, images are referenced by uploaded file id via the Responses API instead.
     """
     validator_system = (
         "You are a strict validator. Read the OCR prompt and the candidate JSON response. "
@@ -315,29 +444,31 @@ def call_validator_yes_no(
         f"{prompt_text}\n\n"
         + (f"{ref_block}\n\n" if ref_block else "")
         + "CANDIDATE JSON RESPONSE:\n"
-        f"{json.dumps(response_json, ensure_ascii=False)}\n\n"
+        f"{json_dumps_bytes(response_json).decode('utf-8')}\n\n"
         "Question: Is this response adequate for this request? Answer Yes or No only."
     )
 
-    content = [{"type": "text", "text": validator_user_text}]
-    for p in image_paths:
-        content.append({
-            "type": "image_url",
-            "image_url": {"url": encode_image_to_data_url(p)}
-        })
+    if file_ids is None:
+        content = [{"type": "text", "text": validator_user_text}]
+        content.extend(image_content_parts(image_paths, image_urls))
 
     for attempt in range(1, max_retries + 1):
         try:
-            resp = client.chat.completions.create(
-                model=model,
-                # temperature=0.0,
-                # max_tokens=5,
-                messages=[
-                    {"role": "system", "content": validator_system},
-                    {"role": "user", "content": content}
-                ]
-            )
-            txt = (resp.choices[0].message.content or "").strip()
+            if file_ids is not None:
+                txt = respond_with_file_images(
+                    client, model, validator_system, [validator_user_text], file_ids
+                ).strip()
+            else:
+                resp = client.chat.completions.create(
+                    model=model,
+                    # temperature=0.0,
+                    # max_tokens=5,
+                    messages=[
+                        {"role": "system", "content": validator_system},
+                        {"role": "user", "content": content}
+                    ]
+                )
+                txt = (resp.choices[0].message.content or "").strip()
             return clamp_yes_no(txt)
         except Exception as e:
             wait = 2 * attempt
@@ -347,6 +478,57 @@ def call_validator_yes_no(
     return "No"
 
 
+# -------------- Local structural check (validator shortcut) --------------
+
+KNOWN_DOCUMENT_TYPES = {"report", "other"}
+STRUCTURAL_MIN_CONFIDENCE = 0.8
+
+_PROMPT_KEY_RE = re.compile(r'"([A-Za-z_][A-Za-z0-9_]*)"\s*:')
+
+@functools.lru_cache(maxsize=8)
+def _prompt_json_keys(prompt_text: str) -> frozenset:
+    """All "key": names that appear in the prompt's JSON schema/example."""
+    return frozenset(_PROMPT_KEY_RE.findall(prompt_text))
+
+def _json_keys(obj) -> set:
+    """All dict keys at any nesting depth of a parsed JSON value."""
+    keys = set()
+    stack = [obj]
+    while stack:
+        o = stack.pop()
+        if isinstance(o, dict):
+            keys.update(o)
+            stack.extend(o.values())
+        elif isinstance(o, list):
+            stack.extend(o)
+    return keys
+
+def _structurally_adequate(result_obj: dict, prompt_text: str) -> Optional[bool]:
+    """
+    Cheap local check run before the validator model call.
+    Returns True if result_obj clearly satisfies the prompt's structure (known document_type,
+    overall_confidence >= STRUCTURAL_MIN_CONFIDENCE, no parse_error, every JSON key named in
+    the prompt's schema present, non-empty candidates for reports); None if inconclusive, in which
+    case the validator model decides.
+    """
+    if "parse_error" in result_obj:
+        return None
+    doc_type = result_obj.get("document_type")
+    if doc_type not in KNOWN_DOCUMENT_TYPES:
+        return None
+    conf = result_obj.get("overall_confidence")
+    if not isinstance(conf, (int, float)) or conf < STRUCTURAL_MIN_CONFIDENCE:
+        return None
+    if doc_type == "report":
+        cands = result_obj.get("candidates")
+        if not isinstance(cands, list) or not cands:
+            return None
+    required = _prompt_json_keys(prompt_text)
+    if not required or not required <= _json_keys(result_obj):
+        return None
+    return True
+
+
 # ------------------- Main logic -------------------
 
 def load_prompt(path: Path) -> str:
@@ -358,14 +540,139 @@ def load_prompt(path: Path) -> str:
 
 def collect_pngs(root: Path) -> List[Path]:
     if root.is_dir():
-        return sorted([p for p in root.iterdir() if p.is_file() and p.suffix.lower() in PNG_EXTS])
+        # scandir's DirEntry carries name and file type, so no Path/stat per entry
+        with os.scandir(root) as it:
+            names = [e.name for e in it if e.is_file() and os.path.splitext(e.name)[1].lower() in PNG_EXTS]
+        return [root / n for n in sorted(names)]
     elif root.is_file() and root.suffix.lower() in PNG_EXTS:
         return [root]
     else:
         return []
 
 def safe_filename(s: str) -> str:
-    return re.sub(r'[\\/:*?"<>|]+', "_", s)
+    # Common case: nothing to replace, str.translate stays entirely in C.
+    # Otherwise use the regex so runs of unsafe chars collapse to one "_".
+    t = s.translate(_UNSAFE_FN_TABLE)
+    if t == s:
+        return s
+    return _UNSAFE_FN_RE.sub("_", s)
+
+# Serializes stdout across worker threads so multi-line group logs stay together
+_PRINT_LOCK = threading.Lock()
+
+def group_prefix_for(key: str, files: List[Path]) -> str:
+    return safe_filename(key) if key else safe_filename(files[0].stem)
+
+def ocr_group(
+    client: OpenAI,
+    model: str,
+    prompt_text: str,
+    reference_candidates: List[str],
+    key: str,
+    files: List[Path],
+    upload: bool = False
+) -> Tuple[dict, Optional[List[str]], Optional[List[str]]]:
+    """
+    Steps 1-2 for one image group: encode (or upload) images, call the OCR model, build the result object.
+    Returns (result_obj, image_urls, file_ids) so the validator stage can reuse the same images;
+    exactly one of image_urls / file_ids is set, depending on upload.
+    """
+    group_prefix = group_prefix_for(key, files)
+    with _PRINT_LOCK:
+        print(f"\n[GROUP] {group_prefix}  ({len(files)} image(s))")
+        for f in files:
+            print(f"  - {f.name}")
+
+    # Encode (or upload) each image once; both the OCR and validator calls send the same pages
+    image_urls = file_ids = None
+    if upload:
+        file_ids = upload_images(client, files)
+    else:
+        image_urls = [encode_image_to_data_url(p) for p in files]
+
+    # 1) Call main OCR/extraction
+    response_json, raw_text = call_model_json(
+        client, model, prompt_text, files, candidate_list=reference_candidates,
+        image_urls=image_urls, file_ids=file_ids
+    )
+
+    # 2) If parsing failed, capture raw text
+    result_obj: dict
+    if response_json:
+        result_obj = response_json
+    else:
+        result_obj = {
+            "document_type": "unknown",
+            "overall_confidence": 0.0,
+            "parse_error": "Model did not return valid JSON. Raw response stored under 'raw_response'.",
+            "raw_response": raw_text or ""
+        }
+
+    # Ensure document_type exists if model omitted it
+    if "document_type" not in result_obj:
+        if isinstance(result_obj.get("candidates"), list) and len(result_obj["candidates"]) > 0:
+            result_obj["document_type"] = "report"
+        else:
+            result_obj["document_type"] = "other"
+
+    # Record whether a reference list was provided
+    result_obj["_reference_list_used"] = bool(reference_candidates)
+    if reference_candidates:
+        # Keep a small sample to avoid bloating output; full list is large and already known locally
+        result_obj["_reference_list_sample"] = reference_candidates[:10]
+
+    return result_obj, image_urls, file_ids
+
+def validate_and_save_group(
+    client: OpenAI,
+    model: str,
+    prompt_text: str,
+    reference_candidates: List[str],
+    out_dir: Path,
+    key: str,
+    files: List[Path],
+    result_obj: dict,
+    image_urls: Optional[List[str]] = None,
+    file_ids: Optional[List[str]] = None,
+    always_validate: bool = False
+) -> None:
+    """
+    Steps 3-5 for one image group: validator call, annotate result_obj, write <group>.json.
+    The validator call is skipped when _structurally_adequate() already says "Yes",
+    unless always_validate is set.
+    Uploaded file_ids (if any) are deleted once the validator call is done.
+    """
+    out_file = out_dir / f"{group_prefix_for(key, files)}.json"
+
+    # 3) Validation (Yes/No): cheap local check first, model call only if inconclusive
+    skip_validator = not always_validate and _structurally_adequate(result_obj, prompt_text)
+    try:
+        if skip_validator:
+            validator_answer = "Yes"
+        else:
+            validator_answer = call_validator_yes_no(
+                client, model, prompt_text, result_obj, files, candidate_list=reference_candidates,
+                image_urls=image_urls, file_ids=file_ids
+            )
+    finally:
+        if file_ids:
+            delete_uploaded_images(client, file_ids)
+
+    # 4) Add validation result to JSON
+    result_obj["is_adequate"] = validator_answer
+    if skip_validator:
+        result_obj["_validator_skipped"] = True
+    else:
+        result_obj["_validator_model"] = model
+    result_obj["_input_files"] = [str(p.name) for p in files]
+
+    # 5) Save JSON
+    try:
+        out_file.write_bytes(json_dumps_bytes(result_obj, indent=True))
+        with _PRINT_LOCK:
+            print(f"[SAVED] {out_file}")
+    except Exception as e:
+        sys.stderr.write(f"ERROR writing {out_file}: {e}\n")
 
 def main():
     ap = argparse.ArgumentParser(description="Batch OCR sender for GPT-5 Thinking with validation (+ optional candidate list).")
@@ -375,10 +682,22 @@ def main():
     ap.add_argument("--out", default="json", help="Output folder for JSON results (default: json).")
     ap.add_argument(
         "--model",
-        default=os.getenv("MODEL_ID", MODEL_ID),
-        help=f"OpenAI model id (default: {os.getenv('MODEL_ID', MODEL_ID)})"
+        default=MODEL_ID,
+        help=f"OpenAI model id (default: {MODEL_ID})"
+    )
+    ap.add_argument("--sleep", type=float, default=0.0, help="Sleep seconds between group submissions (optional).")
+    ap.add_argument(
+        "--upload-images",
+        action="store_true",
+        help="Upload each image once via the Files API and reference it by id in both calls "
+             "(uses the Responses API) instead of sending base64 data URLs twice."
+    )
+    ap.add_argument(
+        "--always-validate",
+        action="store_true",
+        help="Always run the validator model call, even when the JSON passes the local structural check."
     )
-    ap.add_argument("--sleep", type=float, default=0.0, help="Sleep seconds between groups (optional).")
+    ap.add_argument("--concurrency", type=int, default=4, help="Max groups in progress (OCR or validator call) at once; default: 4.")
     args = ap.parse_args()
 
     images_path = Path(args.images)
@@ -405,64 +724,49 @@ def main():
     else:
         print("No reference candidate list provided or the list is empty; proceeding without it.")
 
-    for key, files in groups.items():
-        group_prefix = safe_filename(key) if key else safe_filename(files[0].stem)
-        out_file = out_dir / f"{group_prefix}.json"
-
-        print(f"\n[GROUP] {group_prefix}  ({len(files)} image(s))")
-        for f in files:
-            print(f"  - {f.name}")
-
-        # 1) Call main OCR/extraction
-        response_json, raw_text = call_model_json(
-            client, args.model, prompt_text, files, candidate_list=reference_candidates
-        )
-
-        # 2) If parsing failed, capture raw text
-        result_obj: dict
-        if response_json:
-            result_obj = response_json
-        else:
-            result_obj = {
-                "document_type": "unknown",
-                "overall_confidence": 0.0,
-                "parse_error": "Model did not return valid JSON. Raw response stored under 'raw_response'.",
-                "raw_response": raw_text or ""
-            }
-
-        # Ensure document_type exists if model omitted it
-        if "document_type" not in result_obj:
-            if isinstance(result_obj.get("candidates"), list) and len(result_obj["candidates"]) > 0:
-                result_obj["document_type"] = "report"
-            else:
-                result_obj["document_type"] = "other"
-
-        # Record whether a reference list was provided
-        result_obj["_reference_list_used"] = bool(reference_candidates)
-        if reference_candidates:
-            # Keep a small sample to avoid bloating output; full list is large and already known locally
-            result_obj["_reference_list_sample"] = reference_candidates[:10]
-
-        # 3) Validation call (Yes/No)
-        validator_answer = call_validator_yes_no(
-            client, args.model, prompt_text, result_obj, files, candidate_list=reference_candidates
-        )
+    # Model calls are network-bound, so groups overlap well on threads.
+    # OCR and validation run in separate pools: as soon as a group's OCR call returns,
+    # its validator call is queued, so validating group N overlaps OCR of group N+1.
+    # --sleep spaces out submissions: a group never starts earlier than its submit time.
+    workers = max(1, args.concurrency)
 
-        # 4) Add validation result to JSON
-        result_obj["is_adequate"] = validator_answer
-        result_obj["_validator_model"] = args.model
-        result_obj["_input_files"] = [str(p.name) for p in files]
+    # Held from OCR submit until the group is saved (or fails), so finished OCR results
+    # and their image_urls can't pile up in front of the validator pool.
+    in_progress = threading.BoundedSemaphore(workers)
 
-        # 5) Save JSON
+    def report(fut, key):
         try:
-            out_file.write_text(json.dumps(result_obj, ensure_ascii=False, indent=2), encoding="utf-8")
-            print(f"[SAVED] {out_file}")
+            fut.result()
         except Exception as e:
-            sys.stderr.write(f"ERROR writing {out_file}: {e}\n")
-
-        if args.sleep > 0:
-            time.sleep(args.sleep)
+            sys.stderr.write(f"ERROR processing group {key!r}: {e}\n")
+        finally:
+            in_progress.release()
 
+    def on_ocr_done(fut, key, files):
+        try:
+            result_obj, image_urls, file_ids = fut.result()
+        except Exception as e:
+            sys.stderr.write(f"ERROR processing group {key!r}: {e}\n")
+            in_progress.release()
+            return
+        val_fut = val_pool.submit(
+            validate_and_save_group, client, args.model, prompt_text, reference_candidates,
+            out_dir, key, files, result_obj, image_urls, file_ids, args.always_validate
+        )
+        val_fut.add_done_callback(lambda f: report(f, key))
+
+    # Exit order matters: the OCR pool drains first (its callbacks feed val_pool)
+    with ThreadPoolExecutor(max_workers=workers) as val_pool, \
+            ThreadPoolExecutor(max_workers=workers) as ocr_pool:
+        for i, (key, files) in enumerate(groups.items()):
+            if i and args.sleep > 0:
+                time.sleep(args.sleep)
+            in_progress.acquire()
+            fut = ocr_pool.submit(
+                ocr_group, client, args.model, prompt_text, reference_candidates, key, files,
+                args.upload_images
+            )
+            fut.add_done_callback(lambda f, key=key, files=files: on_ocr_done(f, key, files))
 
 if __name__ == "__main__":
     main()
@@ -13,22 +13,50 @@ Improvements vs previous version:
 Install:
   pip install pillow opencv-python pytesseract
   + Tesseract binary and language packs (e.g., srp, srp_latn, eng)
+  Optional: pip install tesserocr  (in-process Tesseract; models load once per worker)
+  Optional: pip install numba  (fused single-pass projection statistics)
+  Optional: pip install onnxruntime + PP-LCNet_x1_0_doc_ori.onnx (--doc-ori-model)
 """
 
 import argparse
+import functools
 import os
+import re
+import sqlite3
 import sys
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
 from typing import Optional, Tuple
 
 import numpy as np
 from PIL import Image, ImageOps
 import cv2
 
+try:
+    import tesserocr
+    HAVE_TESSEROCR = True
+except Exception:
+    HAVE_TESSEROCR = False
+
 try:
     import pytesseract
-    HAVE_TESS = True
+    HAVE_PYTESSERACT = True
+except Exception:
+    HAVE_PYTESSERACT = False
+
+HAVE_TESS = HAVE_TESSEROCR or HAVE_PYTESSERACT
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except Exception:
+    HAVE_NUMBA = False
+
+try:
+    import onnxruntime as ort
+    HAVE_ORT = True
 except Exception:
-    HAVE_TESS = False
+    HAVE_ORT = False
 
 SUPPORTED_EXTS = {".jpg", ".jpeg", ".png", ".tif", ".tiff", ".bmp", ".webp"}
 
@@ -37,69 +65,195 @@ SUPPORTED_EXTS = {".jpg", ".jpeg", ".png", ".tif", ".tiff", ".bmp", ".webp"}
 def is_image_path(path: str) -> bool:
     return os.path.splitext(path)[1].lower() in SUPPORTED_EXTS
 
+# CW degrees -> PIL transpose (PIL's ROTATE_* constants are CCW); 0 is a no-op
+_TRANSPOSE_CW = {0: None, 90: Image.ROTATE_270, 180: Image.ROTATE_180, 270: Image.ROTATE_90}
+
 def rotate_pil_90s(img: Image.Image, deg_cw: int) -> Image.Image:
     """Rotate by multiples of 90 CW using lossless transposes."""
-    d = deg_cw % 360
-    if d == 0:
-        return img
-    if d == 90:
-        return img.transpose(Image.ROTATE_270)  # PIL's constant is CCW
-    if d == 180:
-        return img.transpose(Image.ROTATE_180)
-    if d == 270:
-        return img.transpose(Image.ROTATE_90)
-    return img.rotate(-deg_cw, expand=True)
+    try:
+        op = _TRANSPOSE_CW[deg_cw % 360]
+    except KeyError:
+        raise ValueError(f"rotate_pil_90s: {deg_cw} is not a multiple of 90") from None
+    return img if op is None else img.transpose(op)
 
 def pil_to_gray(img: Image.Image) -> np.ndarray:
     if img.mode == "L":
         return np.array(img, dtype=np.uint8)
-    arr = np.array(img.convert("RGB"))
-    return cv2.cvtColor(arr, cv2.COLOR_RGB2GRAY)
+    # Pillow's one-pass ITU-R 601 luma; no intermediate RGB buffer
+    return np.asarray(img.convert("L"), dtype=np.uint8)
+
+class _ScratchPool:
+    """
+    Small LRU of reusable work arrays keyed by (tag, shape, dtype). Pages of a batch
+    mostly share a size, so per-image temporaries stop hitting malloc/memset.
+    Only for buffers that never escape the calling function; not thread-safe
+    (each worker process has its own pool).
+    """
+    def __init__(self, maxsize: int = 4):
+        self.maxsize = maxsize
+        self._bufs = OrderedDict()
+
+    def get(self, tag: str, shape: Tuple[int, ...], dtype=np.uint8) -> np.ndarray:
+        key = (tag, shape, np.dtype(dtype).str)
+        buf = self._bufs.pop(key, None)
+        if buf is None:
+            buf = np.empty(shape, dtype)
+            if len(self._bufs) >= self.maxsize:
+                self._bufs.popitem(last=False)
+        self._bufs[key] = buf
+        return buf
+
+_SCRATCH = _ScratchPool()
+
+BIN_BLOCK = 35  # local-mean window (px)
+BIN_C = 15      # a pixel is ink if it is this much darker than its local mean
 
 def binarize(gray: np.ndarray) -> np.ndarray:
     """Adaptive/robust binarization -> text=1, background=0."""
-    # light denoise
-    g = cv2.GaussianBlur(gray, (3,3), 0)
-    # combine Otsu and adaptive to be friendlier to handwriting
-    _, th_otsu = cv2.threshold(255 - g, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-    th_adp = cv2.adaptiveThreshold(255 - g, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
-                                   cv2.THRESH_BINARY, 35, 15)
-    th = cv2.bitwise_or(th_otsu, th_adp)
-    return (th > 0).astype(np.uint8)
+    # light denoise (into a pooled scratch buffer; the result below is a fresh array
+    # because callers keep it)
+    g = cv2.GaussianBlur(gray, (3,3), 0, dst=_SCRATCH.get("blur", gray.shape))
+    # Local mean threshold: ink where g + C < box_mean(g). cv2.blur is a SIMD
+    # running-sum box filter (cost independent of window size), and the saturating
+    # subtract keeps everything in uint8: mean - g is 0 wherever the pixel is lighter.
+    # The box-mean buffer is reused in place for the difference and the 0/1 threshold,
+    # so the result is cv2's own uint8 array (no astype / 0-255 rescale pass).
+    th = cv2.blur(g, (BIN_BLOCK, BIN_BLOCK))
+    cv2.subtract(th, g, dst=th)
+    cv2.threshold(th, BIN_C, 1, cv2.THRESH_BINARY, dst=th)
+    return th
 
 # ---------- Stage A: 0/180 vs 90/270 ----------
 
-def proj_variance_score(bin_img: np.ndarray) -> float:
-    hproj = bin_img.sum(axis=1).astype(np.float32)
-    vproj = bin_img.sum(axis=0).astype(np.float32)
-    if hproj.size: hproj /= (bin_img.shape[1] + 1e-9)
-    if vproj.size: vproj /= (bin_img.shape[0] + 1e-9)
-    return float(hproj.var() / (vproj.var() + 1e-9))
+# Stage A only compares horizontal vs vertical projection variance, a coarse layout
+# signal that survives heavy downscaling (text lines are still several px tall at
+# 600 px), so it runs on a ~10x smaller image than the detail-sensitive stages.
+STAGE_A_MAX_SIDE = 600
+DETAIL_MAX_SIDE = 1600
 
-def pick_pair_0_180_or_90_270(img: Image.Image) -> Tuple[int, int]:
+def prep_image(img: Image.Image, max_side: int = DETAIL_MAX_SIDE,
+               resample: int = Image.BILINEAR) -> np.ndarray:
     """
-    Return the better pair: (0,180) or (90,270).
-    We compute projection-variance scores for 0 and 90 and pick the higher.
+    Downscale to max_side (moderate, for robustness/speed), gray-convert and binarize once.
+    Other orientations are never re-binarized: blur/threshold kernels are symmetric, so
+    their statistics follow from this array (see prep_stats and its callers).
     """
-    # scale moderate for robustness/speed
     w,h = img.size
-    scale = min(1.0, 1600 / max(w,h))
-    work = img if scale==1.0 else img.resize((int(w*scale), int(h*scale)), Image.BILINEAR)
+    scale = min(1.0, max_side / max(w,h))
+    work = img if scale==1.0 else img.resize((int(w*scale), int(h*scale)), resample)
+    return binarize(pil_to_gray(work))
 
-    scores = {}
-    for d in (0, 90):
-        r = rotate_pil_90s(work, d)
-        gray = pil_to_gray(r)
-        bin_img = binarize(gray)
-        scores[d] = proj_variance_score(bin_img)
+def _ink_thresh(W: int) -> int:
+    return max(10, int(0.01 * W))  # ink if row has enough white pixels
+
+def _prep_stats_np(bin_img: np.ndarray, ink_thresh: int) -> Tuple[float, float, int, int]:
+    H, W = bin_img.shape[:2]
+    rows = bin_img.sum(axis=1)
+    hvar = float((rows / W).var())
+    vvar = float((bin_img.sum(axis=0) / H).var())
+    # find first and last 'ink' row (vectorized scan; argmax returns the first True)
+    mask = rows > ink_thresh
+    if not mask.any():
+        return hvar, vvar, 0, 0
+    return hvar, vvar, int(mask.argmax()), int(mask[::-1].argmax())
+
+if HAVE_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _prep_stats_jit(bin_img, ink_thresh):
+        H, W = bin_img.shape
+        cols = np.zeros(W, np.int64)
+        s = 0.0
+        ss = 0.0
+        first = -1
+        last = -1
+        for y in range(H):
+            r = 0
+            for x in range(W):
+                v = bin_img[y, x]
+                r += v
+                cols[x] += v
+            rf = r / W
+            s += rf
+            ss += rf * rf
+            if r > ink_thresh:
+                if first < 0:
+                    first = y
+                last = y
+        hm = s / H
+        vs = 0.0
+        vss = 0.0
+        for x in range(W):
+            cf = cols[x] / H
+            vs += cf
+            vss += cf * cf
+        vm = vs / W
+        if first < 0:
+            return ss / H - hm * hm, vss / W - vm * vm, 0, 0
+        return ss / H - hm * hm, vss / W - vm * vm, first, H - 1 - last
+
+def prep_stats(bin_img: np.ndarray, ink_thresh: int) -> Tuple[float, float, int, int]:
+    """
+    One pass over bin_img -> (row-projection variance, column-projection variance,
+    blank rows above the first ink row, blank rows below the last one).
+    Projections are normalized by the other side's length.
+    """
+    if HAVE_NUMBA:
+        return _prep_stats_jit(bin_img, ink_thresh)
+    return _prep_stats_np(bin_img, ink_thresh)
+
+def pick_pair_0_180_or_90_270(bin_img: np.ndarray) -> Tuple[Tuple[int, int], float]:
+    """
+    Return the better pair, (0,180) or (90,270), and how strongly it won.
+    We compute projection-variance scores for 0 and 90 and pick the higher;
+    ratio is the projection-variance ratio max(hvar, vvar) / min(hvar, vvar) (>= 1).
+    """
+    # Both scores from one pass: a quarter turn just swaps row and column projections
+    hvar, vvar, _, _ = prep_stats(bin_img, 0)
+    scores = {0: hvar / (vvar + 1e-9), 90: vvar / (hvar + 1e-9)}
+    ratio = max(hvar, vvar) / (min(hvar, vvar) + 1e-9)
 
     if scores[0] >= scores[90]:
-        return (0, 180)
+        return (0, 180), ratio
     else:
-        return (90, 270)
+        return (90, 270), ratio
+
+# Stage A projection-variance ratio at or above this means the text axis is certain
+STAGE_A_CONFIDENT_RATIO = 3.0
+# Left/right ink asymmetry beyond this decides 90 vs 270 without OCR
+INK_LR_DECISIVE = 1.25
+# Below this the halves are balanced (e.g. only a border strip): no evidence either way
+INK_LR_MIN = 1.05
+
+def sideways_ink_asymmetry(bin_img: np.ndarray) -> float:
+    """
+    For a sideways page (text lines run vertically in bin_img): ink mass of the half
+    that ends up on the left after a 90 CW turn over the half that ends up on the left
+    after 270. LTR lines are left-aligned with ragged right ends, so the upright left
+    half is heavier: > 1 favors 90, < 1 favors 270.
+    """
+    rows = bin_img.sum(axis=1)
+    half = rows.size // 2
+    top = float(rows[:half].sum())                 # left after 270
+    bottom = float(rows[rows.size - half:].sum())  # left after 90
+    return (bottom + 1.0) / (top + 1.0)
+
+# ---------- Tesseract engine ----------
+
+@functools.lru_cache(maxsize=None)
+def _tess_api(lang: Optional[str], osd: bool = False):
+    """
+    Persistent tesserocr engine for this process, one per (lang, mode).
+    pytesseract spawns a tesseract process (and reloads its models) per call.
+    """
+    if osd:
+        return tesserocr.PyTessBaseAPI(psm=tesserocr.PSM.OSD_ONLY)
+    return tesserocr.PyTessBaseAPI(lang=lang or "eng")
 
 # ---------- Stage B: 0 vs 180 disambiguation ----------
 
+# Runs of str.isalnum characters (Unicode letters/digits, so Cyrillic counts too)
+_ALNUM_RE = re.compile(r"[^\W_]+")
+
 def ocr_confidence_score(img: Image.Image, lang: Optional[str]) -> Tuple[float, int]:
     """
     Return (mean_conf, alpha_num_count). If Tesseract unavailable or failure, (-1, 0).
@@ -114,22 +268,25 @@ def ocr_confidence_score(img: Image.Image, lang: Optional[str]) -> Tuple[float,
             s = 900/long_side
             img = img.resize((int(w*s), int(h*s)), Image.BILINEAR)
 
-        cfg_lang = lang if lang else None
-        data = pytesseract.image_to_data(img, lang=cfg_lang, output_type=pytesseract.Output.DICT)
-        confs = []
-        alnum = 0
-        for txt, conf in zip(data.get("text", []), data.get("conf", [])):
-            try:
-                c = float(conf)
-            except Exception:
-                continue
-            if c <= 0:
-                continue
-            if txt and any(ch.isalnum() for ch in txt):
-                confs.append(c)
-                alnum += sum(ch.isalnum() for ch in txt)
-        mean_conf = float(np.mean(confs)) if confs else -1.0
-        return (mean_conf, alnum)
+        if HAVE_TESSEROCR:
+            api = _tess_api(lang)
+            api.SetImage(img)
+            words = api.MapWordConfidences()  # [(word, conf)], recognizes on demand
+            texts = [w for w, _ in words]
+            confs = np.array([c for _, c in words], dtype=np.float64)
+        else:
+            cfg_lang = lang if lang else None
+            data = pytesseract.image_to_data(img, lang=cfg_lang, output_type=pytesseract.Output.DICT)
+            texts = data.get("text", [])
+            confs = np.asarray(data.get("conf", []), dtype=np.float64)
+        # column arrays: per-token alnum counts, then keep confident tokens with any alnum
+        n = min(len(texts), confs.size)
+        n_alnum = np.fromiter((sum(map(len, _ALNUM_RE.findall(t))) if t else 0 for t in texts[:n]),
+                              dtype=np.int64, count=n)
+        keep = (confs[:n] > 0) & (n_alnum > 0)
+        if not keep.any():
+            return (-1.0, 0)
+        return (float(confs[:n][keep].mean()), int(n_alnum[keep].sum()))
     except Exception:
         return (-1.0, 0)
 
@@ -138,43 +295,56 @@ def whitespace_top_bottom_ratio(img: Image.Image) -> float:
     Heuristic: top margin is usually smaller than bottom.
     Return top_whitespace / (bottom_whitespace + 1).
     Lower is better for 'upright'.
+    Kept for callers with a PIL image; the pipeline reads the margins straight from
+    prep_stats on its shared bin array (see choose_0_vs_180).
     """
-    gray = pil_to_gray(img)
-    bin_img = binarize(gray)
-    rows = bin_img.sum(axis=1)
-    H = rows.shape[0]
-    # find first and last 'ink' row
-    thresh = max(10, int(0.01 * bin_img.shape[1]))  # ink if row has enough white pixels
-    top_idx = next((i for i,v in enumerate(rows) if v > thresh), 0)
-    bot_idx = next((i for i,v in enumerate(rows[::-1]) if v > thresh), 0)
-    bottom_last = H - 1 - bot_idx
-    top_ws = top_idx
-    bottom_ws = max(0, H - 1 - bottom_last)
+    bin_img = binarize(pil_to_gray(img))
+    _, _, top_ws, bottom_ws = prep_stats(bin_img, _ink_thresh(bin_img.shape[1]))
     return top_ws / (bottom_ws + 1e-6)
 
-def choose_0_vs_180(img: Image.Image, lang: Optional[str]) -> int:
+# Smaller/larger page margin at or below this decides 0 vs 180 without running OCR
+# (one margin at least twice the other)
+WS_DECISIVE_MARGIN_RATIO = 0.5
+
+def choose_0_vs_180(img: Image.Image, lang: Optional[str], bin_img: Optional[np.ndarray] = None,
+                    fast: bool = False) -> int:
     """
-    Return 0 or 180 for 'upright'. Prefer OCR confidence; fallback to whitespace heuristic.
+    Return 0 or 180 for 'upright'. A decisive whitespace heuristic wins outright;
+    otherwise prefer OCR confidence, then the weaker whitespace signal.
+    bin_img: detail-resolution binarized copy (prep_image); built here if not given.
+    fast: never run OCR, decide from whitespace alone.
     """
-    # 1) OCR comparison
-    conf0, al0 = ocr_confidence_score(img, lang)
-    conf180, al180 = ocr_confidence_score(rotate_pil_90s(img, 180), lang)
-
-    if conf0 >= 0 or conf180 >= 0:
-        # combine mean conf + a tiny bonus for more recognized chars
-        s0 = conf0 + 0.05 * np.log1p(al0) if conf0 >= 0 else -1e9
-        s180 = conf180 + 0.05 * np.log1p(al180) if conf180 >= 0 else -1e9
-        if s0 != s180:
-            return 0 if s0 > s180 else 180
-
-    # 2) Layout asymmetry fallback
-    r0 = whitespace_top_bottom_ratio(img)
-    r180 = whitespace_top_bottom_ratio(rotate_pil_90s(img, 180))
-    # Prefer the orientation with smaller top/bottom ratio
+    # 1) Layout asymmetry first: cheap, and spares both Tesseract passes on easy pages
+    bin0 = prep_image(img) if bin_img is None else bin_img
+    # The 180 degree view is bin0[::-1, ::-1]: its row sums are rows0 reversed, so its
+    # top/bottom margins are just bin0's swapped - one projection serves both.
+    _, _, top_ws, bottom_ws = prep_stats(bin0, _ink_thresh(bin0.shape[1]))
+    r0 = top_ws / (bottom_ws + 1e-6)
+    r180 = bottom_ws / (top_ws + 1e-6)  # == 1/r0, so compare the margins themselves
+    # Both margins must be measured: a blank page (no ink row) or ink touching an edge
+    # (scanner border strip, full-bleed page) gives 0 and says nothing about up/down.
+    lo, hi = min(top_ws, bottom_ws), max(top_ws, bottom_ws)
+    if lo > 0 and lo / hi <= WS_DECISIVE_MARGIN_RATIO:
+        # Prefer the orientation with the smaller top margin
+        return 0 if top_ws < bottom_ws else 180
+
+    # 2) OCR comparison for genuinely ambiguous layouts
+    if not fast:
+        conf0, al0 = ocr_confidence_score(img, lang)
+        conf180, al180 = ocr_confidence_score(rotate_pil_90s(img, 180), lang)
+
+        if conf0 >= 0 or conf180 >= 0:
+            # combine mean conf + a tiny bonus for more recognized chars
+            s0 = conf0 + 0.05 * np.log1p(al0) if conf0 >= 0 else -1e9
+            s180 = conf180 + 0.05 * np.log1p(al180) if conf180 >= 0 else -1e9
+            if s0 != s180:
+                return 0 if s0 > s180 else 180
+
+    # 3) Weak layout asymmetry
     if abs(r0 - r180) > 0.05:
         return 0 if r0 < r180 else 180
 
-    # 3) If still ambiguous, keep as-is
+    # 4) If still ambiguous, keep as-is
     return 0
 
 # ---------- OSD (still useful for 90/270 and printed pages) ----------
@@ -187,9 +357,18 @@ def tesseract_osd_deg(img: Image.Image) -> Optional[int]:
         long_side = max(w,h)
         if long_side > 2000:
             s = 2000/long_side
-            im = img.resize((int(w*s), int(h*s)), Image.BILINEAR)
+            im = img.resize((int(w*s), int(h*s)), Image.NEAREST)  # OSD tolerates it, much cheaper
         else:
             im = img
+        if HAVE_TESSEROCR:
+            api = _tess_api(None, osd=True)
+            api.SetImage(im)
+            res = api.DetectOrientationScript()
+            if not res:
+                return None
+            # orient_deg is the page's current CCW rotation; OSD's "Rotate:" is its complement
+            deg = (360 - res["orient_deg"]) % 360
+            return deg if deg in (0,90,180,270) else None
         osd = pytesseract.image_to_osd(im)
         for line in osd.splitlines():
             if "Rotate:" in line:
@@ -200,37 +379,93 @@ def tesseract_osd_deg(img: Image.Image) -> Optional[int]:
     except Exception:
         return None
 
+# ---------- Classifier (optional PP-LCNet doc_ori ONNX model) ----------
+
+# Label L: the page content is rotated L degrees CW (PaddleX corrects it by rotating L CCW),
+# so the CW correction returned here is (360 - L) % 360.
+DOC_ORI_LABELS = (0, 90, 180, 270)
+DOC_ORI_MIN_CONF = 0.35
+_IMAGENET_MEAN = np.array([0.485, 0.456, 0.406], dtype=np.float32)
+_IMAGENET_STD = np.array([0.229, 0.224, 0.225], dtype=np.float32)
+
+@functools.lru_cache(maxsize=None)
+def _doc_ori_session(model_path: str):
+    """Load the ONNX model once per process."""
+    return ort.InferenceSession(model_path, providers=["CPUExecutionProvider"])
+
+def classifier_deg(img: Image.Image, model_path: Optional[str]) -> Optional[int]:
+    """
+    One 224x224 forward pass of the doc_ori classifier. Returns CW degrees to make
+    the image upright, or None if unavailable or below DOC_ORI_MIN_CONF.
+    """
+    if not (HAVE_ORT and model_path):
+        return None
+    try:
+        # resize short side to 256, center-crop 224, ImageNet normalization (BGR, CHW)
+        w,h = img.size
+        s = 256 / min(w,h)
+        im = img.convert("RGB").resize((max(224, round(w*s)), max(224, round(h*s))), Image.BILINEAR)
+        l, t = (im.width - 224) // 2, (im.height - 224) // 2
+        arr = np.asarray(im.crop((l, t, l + 224, t + 224)), dtype=np.float32)[:, :, ::-1] / 255.0
+        x = ((arr - _IMAGENET_MEAN) / _IMAGENET_STD).transpose(2, 0, 1)[None]
+        sess = _doc_ori_session(model_path)
+        out = sess.run(None, {sess.get_inputs()[0].name: np.ascontiguousarray(x)})[0][0]
+        out = out.astype(np.float64)
+        # exported models may already end in softmax
+        if not (out.min() >= 0 and abs(out.sum() - 1.0) < 1e-3):
+            out = np.exp(out - out.max())
+            out /= out.sum()
+        i = int(out.argmax())
+        if out[i] <= DOC_ORI_MIN_CONF:
+            return None
+        return (360 - DOC_ORI_LABELS[i]) % 360
+    except Exception:
+        return None
+
 # ---------- Decision logic ----------
 
-def decide_orientation(img: Image.Image, lang: Optional[str]) -> int:
+def decide_orientation(img: Image.Image, lang: Optional[str], fast: bool = False,
+                       model_path: Optional[str] = None) -> int:
     """
     Final rotation in CW degrees to make image upright.
+    fast: decide 0 vs 180 from page layout only (no OCR pass).
+    model_path: optional doc_ori ONNX model; a confident prediction skips everything else.
     """
+    deg_cls = classifier_deg(img, model_path)
+    if deg_cls is not None:
+        return deg_cls
     # Normalize any EXIF rotation effects already outside
     # Try OSD first for a quick win on printed pages
     deg_osd = tesseract_osd_deg(img)
     if deg_osd in (90, 270):
         return deg_osd
     # For 0/180 from OSD we still verify with Stage B (helps handwriting/tables)
+    # Small gray + binarized working copy for Stage A (and the projection fallback).
+    # NEAREST downscale: one tap per output pixel; projection variance needs no smooth edges.
+    bin_a = prep_image(img, STAGE_A_MAX_SIDE, Image.NEAREST)
     # Stage A: choose pair
-    a, b = pick_pair_0_180_or_90_270(img)
+    (a, b), ratio = pick_pair_0_180_or_90_270(bin_a)
     if (a, b) == (0, 180):
-        d = choose_0_vs_180(img, lang)
+        d = choose_0_vs_180(img, lang, fast=fast)
         return d
     else:  # (90,270) -> we know it's sideways; pick which one
-        # Decide between 90 and 270 by OCR confidence if available; else projection variance
-        img90 = rotate_pil_90s(img, 90)
-        img270 = rotate_pil_90s(img, 270)
-        conf90, al90 = ocr_confidence_score(img90, lang)
-        conf270, al270 = ocr_confidence_score(img270, lang)
+        asym = sideways_ink_asymmetry(bin_a)
+        # Axis certain and left/right ink clearly lopsided: no OCR needed
+        if ratio >= STAGE_A_CONFIDENT_RATIO and max(asym, 1 / asym) >= INK_LR_DECISIVE:
+            return 90 if asym > 1 else 270
+        # Decide between 90 and 270 by OCR confidence if available; else ink asymmetry
+        # (one full-size rotated copy alive at a time)
+        conf90, al90 = ocr_confidence_score(rotate_pil_90s(img, 90), lang)
+        conf270, al270 = ocr_confidence_score(rotate_pil_90s(img, 270), lang)
         if conf90 >= 0 or conf270 >= 0:
             s90 = conf90 + 0.05*np.log1p(al90) if conf90>=0 else -1e9
             s270 = conf270 + 0.05*np.log1p(al270) if conf270>=0 else -1e9
             return 90 if s90 >= s270 else 270
-        # fallback: pick higher proj variance
-        s90v = proj_variance_score(binarize(pil_to_gray(img90)))
-        s270v = proj_variance_score(binarize(pil_to_gray(img270)))
-        return 90 if s90v >= s270v else 270
+        # fallback: heavier left half (projection variance can't tell 90 from 270);
+        # balanced halves give no evidence, so keep as-is rather than rotate blindly
+        if max(asym, 1 / asym) < INK_LR_MIN:
+            return 0
+        return 90 if asym > 1 else 270
 
 # ---------- I/O ----------
 
@@ -243,16 +478,63 @@ def save_with_exif_preserved(src: Image.Image, out_img: Image.Image, path: str)
         if exif: params["exif"] = exif
     out_img.save(path, **params)
 
-def process_image(path: str, lang: Optional[str], dry_run: bool=False) -> Tuple[bool, Optional[int]]:
+# ---------- Decision cache (optional, --cache) ----------
+
+_CACHE_SCHEMA = """CREATE TABLE IF NOT EXISTS decisions (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    settings TEXT NOT NULL,
+    deg INTEGER NOT NULL
+)"""
+
+@functools.lru_cache(maxsize=None)
+def _cache_db(db_path: str) -> sqlite3.Connection:
+    """One autocommit connection per process; workers share the file via SQLite locking."""
+    os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+    con = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+    con.execute("PRAGMA journal_mode=WAL")
+    con.execute(_CACHE_SCHEMA)
+    return con
+
+def cache_get(db_path: str, path: str, st: os.stat_result, settings: str) -> Optional[int]:
+    """Cached rotation for path if the file (mtime, size) and settings are unchanged."""
+    row = _cache_db(db_path).execute(
+        "SELECT mtime_ns, size, settings, deg FROM decisions WHERE path = ?", (path,)).fetchone()
+    if row and row[:3] == (st.st_mtime_ns, st.st_size, settings):
+        return row[3]
+    return None
+
+def cache_put(db_path: str, path: str, st: os.stat_result, settings: str, deg: int) -> None:
+    _cache_db(db_path).execute(
+        "INSERT OR REPLACE INTO decisions (path, mtime_ns, size, settings, deg) VALUES (?, ?, ?, ?, ?)",
+        (path, st.st_mtime_ns, st.st_size, settings, deg))
+
+def process_image(path: str, lang: Optional[str], dry_run: bool=False,
+                  fast: bool=False, model_path: Optional[str]=None,
+                  cache_path: Optional[str]=None) -> Tuple[bool, Optional[int]]:
     try:
+        deg = None
+        if cache_path:
+            key_path = os.path.abspath(path)
+            settings = f"{lang}|{int(fast)}|{model_path}"
+            deg = cache_get(cache_path, key_path, os.stat(path), settings)
+            if deg == 0:  # upright, or already rotated in place by an earlier run
+                return (False, 0)
         with Image.open(path) as im:
             im = ImageOps.exif_transpose(im)  # neutralize EXIF Orientation
-            deg = decide_orientation(im, lang)
+            if deg is None:
+                deg = decide_orientation(im, lang, fast, model_path)
+                if cache_path:
+                    cache_put(cache_path, key_path, os.stat(path), settings, deg)
             if deg % 360 == 0:
                 return (False, 0)
             rot = rotate_pil_90s(im, deg)
             if not dry_run:
                 save_with_exif_preserved(im, rot, path)
+                if cache_path:
+                    # the rewritten file is upright: key it by its new mtime/size
+                    cache_put(cache_path, key_path, os.stat(path), settings, 0)
             return (True, deg)
     except Exception as e:
         print(f"[ERROR] {path}: {e}", file=sys.stderr)
@@ -273,6 +555,25 @@ def iter_paths(root: str, recursive: bool):
             p = os.path.join(root, fn)
             if os.path.isfile(p) and is_image_path(p): yield p
 
+def _init_worker() -> None:
+    # One image per process already uses every core; avoid nested OpenCV thread pools
+    cv2.setNumThreads(1)
+
+def _imap_unordered(pool: ProcessPoolExecutor, paths, job_args: tuple, window: int):
+    """
+    Yield (path, process_image result) as workers finish. Paths are submitted while
+    the directory walk is still running, with at most `window` in flight.
+    """
+    pending = {}
+    for p in paths:
+        pending[pool.submit(process_image, p, *job_args)] = p
+        if len(pending) >= window:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for f in done:
+                yield pending.pop(f), f.result()
+    for f in as_completed(pending):
+        yield pending[f], f.result()
+
 def main():
     ap = argparse.ArgumentParser(description="Auto-rotate document images upright (LTR text).")
     ap.add_argument("input_path", help="File or folder")
@@ -280,18 +581,35 @@ def main():
     ap.add_argument("--dry-run", action="store_true", help="Report without writing")
     ap.add_argument("--lang", default=None,
                     help="Tesseract language(s), e.g. 'srp+srp_latn+eng'. Ignored if Tesseract not installed.")
+    ap.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                    help="Images processed in parallel worker processes (default: CPU count; 1 = serial).")
+    ap.add_argument("--fast", action="store_true",
+                    help="Decide 0 vs 180 from page layout only (no OCR passes).")
+    ap.add_argument("--doc-ori-model", default=os.getenv("ORIENT_DOC_ORI_MODEL"),
+                    help="Path to PP-LCNet_x1_0_doc_ori .onnx (needs onnxruntime); tried before OSD/OCR. "
+                         "Default: $ORIENT_DOC_ORI_MODEL.")
+    ap.add_argument("--cache", default=None, metavar="DB",
+                    help="SQLite file remembering decisions per image (e.g. ~/.cache/orient.db); "
+                         "unchanged files are skipped on re-runs.")
     args = ap.parse_args()
+    cache_path = os.path.expanduser(args.cache) if args.cache else None
 
-    paths = list(iter_paths(args.input_path, args.recursive))
-    if not paths:
-        print("No supported images found.")
-        return
+    # Streamed: processing starts on the first file instead of after the whole walk
+    paths = iter_paths(args.input_path, args.recursive)
+    job_args = (args.lang, args.dry_run, args.fast, args.doc_ori_model, cache_path)
 
     changed = 0
     total = 0
-    for p in paths:
+    if args.jobs > 1 and not os.path.isfile(args.input_path):
+        # Images are independent; OpenCV/PIL work and Tesseract subprocesses scale across cores
+        pool = ProcessPoolExecutor(max_workers=args.jobs, initializer=_init_worker)
+        results = _imap_unordered(pool, paths, job_args, window=4 * args.jobs)
+    else:
+        pool = None
+        results = ((p, process_image(p, *job_args)) for p in paths)
+
+    for p, (chg, deg) in results:
         total += 1
-        chg, deg = process_image(p, args.lang, args.dry_run)
         if deg is None:
             print(f"[SKIP] {p}")
         elif chg:
@@ -299,6 +617,11 @@ def main():
             changed += 1
         else:
             print(f"[ALREADY UPRIGHT] {p}")
+    if pool is not None:
+        pool.shutdown()
+    if total == 0:
+        print("No supported images found.")
+        return
 
     if args.dry_run:
         print(f"\nDry-run: {changed}/{total} would be rotated.")
@@ -0,0 +1,97 @@
+"""
+Parsing checks for env_setup.parse_dotenv (expected values match the original regex parser).
+
+Run from the repo root:
+    python -m unittest discover -s tests
+"""
+
+import os
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import env_setup  # noqa: E402
+
+
+class ParseDotenv(unittest.TestCase):
+    def setUp(self):
+        # ${VAR} falls back to os.environ; keep that part deterministic
+        patcher = mock.patch.dict(os.environ, {"HOME_DIR": "/home/x"}, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def check(self, cases):
+        for text, expected in cases:
+            with self.subTest(text=text):
+                self.assertEqual(env_setup.parse_dotenv(text), expected)
+
+    def test_export_prefix(self):
+        self.check([
+            ("export FOO=bar", {"FOO": "bar"}),
+            ("export   FOO=bar", {"FOO": "bar"}),
+            ("export\tFOO=bar", {"FOO": "bar"}),
+            # no key after the prefix: "export" itself is the key
+            ("export =x", {"export": "x"}),
+            ("export=x", {"export": "x"}),
+            ("exportFOO=1", {"exportFOO": "1"}),
+            ("export FOO", {}),
+            ("export", {}),
+        ])
+
+    def test_quoted_and_unquoted_values(self):
+        self.check([
+            ("A='single quoted'", {"A": "single quoted"}),
+            ('B="double quoted"', {"B": "double quoted"}),
+            ("C=unquoted value", {"C": "unquoted value"}),
+            ("  K  =  v  ", {"K": "v"}),
+            ("G=''", {"G": ""}),
+            ('H=""', {"H": ""}),
+            ("I='unterminated", {"I": "'unterminated"}),
+            # no inline comments, quoted or not
+            ("E=a # not a comment", {"E": "a # not a comment"}),
+            ('F="a # b"', {"F": "a # b"}),
+            ("A=b=c", {"A": "b=c"}),
+            ("A==b", {"A": "=b"}),
+        ])
+
+    def test_interpolation(self):
+        self.check([
+            ("A=1\nB=$A", {"A": "1", "B": "1"}),
+            ("A=1\nB=${A}x", {"A": "1", "B": "1x"}),
+            ("A=1\nB='$A'", {"A": "1", "B": "1"}),
+            ("B=${HOME_DIR}/p", {"B": "/home/x/p"}),
+            # not a name, or not set anywhere: left as written
+            ("B=$1", {"B": "$1"}),
+            ("B=${}", {"B": "${}"}),
+            ("B=$", {"B": "$"}),
+            ("B=${A", {"B": "${A"}),
+            ("B=$UNSET-", {"B": "$UNSET-"}),
+        ])
+
+    def test_parsed_keys_shadow_environ(self):
+        self.check([("HOME_DIR=/tmp\nB=$HOME_DIR", {"HOME_DIR": "/tmp", "B": "/tmp"})])
+
+    def test_non_ascii_keys_are_skipped(self):
+        self.check([
+            ("ÄÖ=1", {}),
+            ("ключ=значение", {}),
+            ("ÄÖ=1\nX=${ÄÖ}", {"X": "${ÄÖ}"}),
+            ("X=$ключ", {"X": "$ключ"}),
+        ])
+
+    def test_malformed_lines_are_skipped(self):
+        self.check([
+            ("no equals here", {}),
+            ("=novalue", {}),
+            ("1ABC=x", {}),
+            ("A B=x", {}),
+            ("# comment", {}),
+            ("   ", {}),
+            ("bad line\nGOOD=1\n=x", {"GOOD": "1"}),
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()
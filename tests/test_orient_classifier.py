@@ -0,0 +1,68 @@
+"""
+Round-trip check for orient.classifier_deg with a stub ONNX session.
+
+Run from the repo root:
+    python -m unittest discover -s tests
+"""
+
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import orient  # noqa: E402
+
+
+class _Input:
+    name = "x"
+
+
+class _StubSession:
+    """Returns fixed class scores, like an InferenceSession for the doc_ori model."""
+
+    def __init__(self, scores):
+        self.scores = np.asarray([scores], dtype=np.float32)
+
+    def get_inputs(self):
+        return [_Input()]
+
+    def run(self, _outputs, feed):
+        assert feed["x"].shape == (1, 3, 224, 224)
+        return [self.scores]
+
+
+def _upright_page() -> Image.Image:
+    # Asymmetric content so every quarter turn is distinguishable
+    rng = np.random.default_rng(0)
+    return Image.fromarray(rng.integers(0, 256, (320, 240, 3), dtype=np.uint8))
+
+
+class ClassifierRoundTrip(unittest.TestCase):
+    def classify(self, img, scores):
+        with mock.patch.object(orient, "HAVE_ORT", True), \
+                mock.patch.object(orient, "_doc_ori_session", lambda _path: _StubSession(scores)):
+            return orient.classifier_deg(img, "stub.onnx")
+
+    def test_each_label_is_corrected_to_upright(self):
+        upright = _upright_page()
+        for i, label in enumerate(orient.DOC_ORI_LABELS):
+            with self.subTest(label=label):
+                # a page whose content is rotated `label` degrees CW gets class `label`
+                page = orient.rotate_pil_90s(upright, label)
+                scores = [0.0] * len(orient.DOC_ORI_LABELS)
+                scores[i] = 1.0
+                deg = self.classify(page, scores)
+                self.assertIsNotNone(deg)
+                fixed = orient.rotate_pil_90s(page, deg)
+                self.assertTrue(np.array_equal(np.asarray(fixed), np.asarray(upright)))
+
+    def test_low_confidence_falls_back(self):
+        self.assertIsNone(self.classify(_upright_page(), [0.3, 0.25, 0.25, 0.2]))
+
+
+if __name__ == "__main__":
+    unittest.main()